@@ -63,14 +63,31 @@ def returns_json(decorated_func):
     @functools.wraps(decorated_func)
     def decorator(*args, **kwargs):
         response = decorated_func(*args, **kwargs)
-        if isinstance(response, flask.Response):
-            return response
-        if isinstance(response, tuple):
-            contents, status, *headers = response
-        else:
-            contents, status, headers = response, 200, ()
-        kwargs = {'headers': headers[0]} if headers else {}
-        return flask.Response(response=contents, status=status,
-                              content_type='application/json', **kwargs)
+        if not isinstance(response, flask.Response):
+            if isinstance(response, tuple):
+                contents, status, *headers = response
+            else:
+                contents, status, headers = response, 200, ()
+            kwargs = {'headers': headers[0]} if headers else {}
+            response = flask.Response(response=contents, status=status,
+                                      content_type='application/json',
+                                      **kwargs)
+
+        return make_conditional(response)
 
     return decorator
+
+
+def make_conditional(response):
+    """Tag a successful GET response with an ETag.
+
+    Clients that send the matching ETag in `If-None-Match` get an empty
+    `304 Not Modified` response instead of the full document. HEAD is
+    left alone as some routes only render their document for GET, and
+    tagging their empty HEAD body would not match the GET ETag.
+    """
+    if flask.request.method == 'GET' and response.status_code == 200:
+        response.add_etag()
+        response.make_conditional(flask.request)
+
+    return response
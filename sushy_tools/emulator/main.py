@@ -15,12 +15,15 @@
 
 import argparse
 from datetime import datetime
+from datetime import timezone
+import functools
 import json
 import os
 import ssl
 import sys
 
 import flask
+from flask.json import provider as json_provider
 from werkzeug import exceptions as wz_exc
 
 from sushy_tools.emulator import api_utils
@@ -28,20 +31,21 @@ from sushy_tools.emulator import auth_basic
 from sushy_tools.emulator.controllers import certificate_service as certctl
 from sushy_tools.emulator.controllers import update_service as usctl
 from sushy_tools.emulator.controllers import virtual_media as vmctl
-from sushy_tools.emulator import memoize
 from sushy_tools.emulator.resources import chassis as chsdriver
 from sushy_tools.emulator.resources import drives as drvdriver
 from sushy_tools.emulator.resources import indicators as inddriver
 from sushy_tools.emulator.resources import managers as mgrdriver
 from sushy_tools.emulator.resources import storage as stgdriver
-from sushy_tools.emulator.resources.systems import fakedriver
-from sushy_tools.emulator.resources.systems import ironicdriver
-from sushy_tools.emulator.resources.systems import libvirtdriver
-from sushy_tools.emulator.resources.systems import novadriver
 from sushy_tools.emulator.resources import vmedia as vmddriver
 from sushy_tools.emulator.resources import volumes as voldriver
 from sushy_tools import error
 
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
 
 def _render_error(message):
     return {
@@ -59,13 +63,29 @@ def _render_error(message):
     }
 
 
+def _find_member(members, member_id, key='id'):
+    """Return the collection member with the given ID.
+
+    :param members: an iterable of member dicts as returned by a driver
+    :param member_id: the ID to look for
+    :param key: the name of the ID field of the members
+    :raises: NotFound if no member has the ID
+    :returns: the first matching member
+    """
+    member = next((m for m in members if m[key] == member_id), None)
+    if member is None:
+        raise error.NotFound()
+
+    return member
+
+
 class RedfishAuthMiddleware(auth_basic.BasicAuthMiddleware):
 
-    _EXCLUDE_PATHS = frozenset(['', 'redfish', 'redfish/v1'])
+    _EXCLUDE_PATHS = frozenset(['', '/', 'redfish', '/redfish', '/redfish/',
+                                'redfish/v1', '/redfish/v1', '/redfish/v1/'])
 
     def __call__(self, env, start_response):
-        path = env.get('PATH_INFO', '')
-        if path.strip('/') in self._EXCLUDE_PATHS:
+        if env.get('PATH_INFO', '') in self._EXCLUDE_PATHS:
             return self.app(env, start_response)
         else:
             return super().__call__(env, start_response)
@@ -76,18 +96,76 @@ class RedfishAuthMiddleware(auth_basic.BasicAuthMiddleware):
         return response
 
 
+class JSONProvider(json_provider.DefaultJSONProvider):
+    """JSON provider using orjson when it is installed."""
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(
+            obj, default=kwargs.get('default', self.default),
+            option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+
+        return orjson.loads(s)
+
+
 class Application(flask.Flask):
 
+    json_provider_class = JSONProvider
+
+    RESOURCES = ('systems', 'managers', 'chassis', 'indicators', 'vmedia',
+                 'storage', 'drives', 'volumes')
+
     def __init__(self):
         super().__init__(__name__)
         # Turn off strict_slashes on all routes
         self.url_map.strict_slashes = False
+        self._rendered_templates = {}
+        # Templates ship with the package, do not check them for changes
+        # on every render even in debug mode
+        self.config['TEMPLATES_AUTO_RELOAD'] = False
         # This is needed for WSGI since it cannot process argv
         self.configure(config_file=os.environ.get('SUSHY_EMULATOR_CONFIG'))
 
         @self.before_request
         def reset_cache():
-            self._cache = {}
+            # Drivers live as long as the application, but the lookups
+            # they memoize (e.g. libvirt domains or nova instances) must
+            # not outlive a single request.
+            for name in self.RESOURCES:
+                driver = self.__dict__.get(name)
+                if driver is not None:
+                    vars(driver).pop('_cache', None)
+
+    def init_resources(self):
+        """Build all the resource drivers ahead of the first request.
+
+        Driver initialization may take a while (e.g. connecting to
+        libvirt or OpenStack), calling this method moves that cost out of
+        the request path. A later `configure` call drops the drivers
+        again, so that they are rebuilt from the new configuration.
+        """
+        for name in self.RESOURCES:
+            getattr(self, name)
+
+    def reset_resources(self):
+        """Drop all the cached resource drivers.
+
+        The drivers are built anew on the next access.
+        """
+        for name in self.RESOURCES:
+            self.__dict__.pop(name, None)
 
     def configure(self, config_file=None, extra_config=None):
         if config_file:
@@ -103,6 +181,10 @@ class Application(flask.Flask):
         if feature_set not in ('full', 'vmedia', 'minimum'):
             raise RuntimeError(f"Invalid feature set {self.feature_set}")
 
+        # Drivers and rendered templates may depend on the old configuration
+        self.reset_resources()
+        self._rendered_templates.clear()
+
     @property
     def feature_set(self):
         return self.config.get('SUSHY_EMULATOR_FEATURE_SET', 'full')
@@ -111,18 +193,45 @@ class Application(flask.Flask):
         params.setdefault('feature_set', self.feature_set)
         return flask.render_template(template_name, **params)
 
-    @property
-    @memoize.memoize()
+    def render_cached_template(self, template_name, /, **params):
+        """Render a template, reusing the result of an identical call.
+
+        Only suitable for templates that depend on nothing but their
+        parameters and the feature set. List parameters are compared by
+        value, so e.g. a collection is only re-rendered when its members
+        change. Just the latest rendering of each template is kept, and
+        the cache is dropped on every `configure` call.
+        """
+        key = (template_name, self.feature_set)
+        params_key = tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted(params.items()))
+
+        cached = self._rendered_templates.get(key)
+        if cached is not None and cached[0] == params_key:
+            return cached[1]
+
+        result = self.render_template(template_name, **params)
+        self._rendered_templates[key] = params_key, result
+        return result
+
+    @functools.cached_property
     def systems(self):
         fake = self.config.get('SUSHY_EMULATOR_FAKE_DRIVER')
         os_cloud = self.config.get('SUSHY_EMULATOR_OS_CLOUD')
         ironic_cloud = self.config.get('SUSHY_EMULATOR_IRONIC_CLOUD')
 
+        # Only import the selected driver, the client libraries behind the
+        # others (libvirt, openstacksdk) are slow to import and memory hungry
         if fake:
+            from sushy_tools.emulator.resources.systems import fakedriver
+
             result = fakedriver.FakeDriver.initialize(
                 self.config, self.logger)()
 
         elif os_cloud:
+            from sushy_tools.emulator.resources.systems import novadriver
+
             if not novadriver.is_loaded:
                 self.logger.error('Nova driver not loaded')
                 sys.exit(1)
@@ -131,6 +240,8 @@ class Application(flask.Flask):
                 self.config, self.logger, os_cloud)()
 
         elif ironic_cloud:
+            from sushy_tools.emulator.resources.systems import ironicdriver
+
             if not ironicdriver.is_loaded:
                 self.logger.error('Ironic driver not loaded')
                 sys.exit(1)
@@ -139,6 +250,8 @@ class Application(flask.Flask):
                 self.config, self.logger, ironic_cloud)()
 
         else:
+            from sushy_tools.emulator.resources.systems import libvirtdriver
+
             if not libvirtdriver.is_loaded:
                 self.logger.error('libvirt driver not loaded')
                 sys.exit(1)
@@ -152,24 +265,20 @@ class Application(flask.Flask):
                           result)
         return result
 
-    @property
-    @memoize.memoize()
+    @functools.cached_property
     def managers(self):
         return mgrdriver.FakeDriver(self.config, self.logger,
                                     self.systems, self.chassis)
 
-    @property
-    @memoize.memoize()
+    @functools.cached_property
     def chassis(self):
         return chsdriver.StaticDriver(self.config, self.logger)
 
-    @property
-    @memoize.memoize()
+    @functools.cached_property
     def indicators(self):
         return inddriver.StaticDriver(self.config, self.logger)
 
-    @property
-    @memoize.memoize()
+    @functools.cached_property
     def vmedia(self):
         os_cloud = self.config.get('SUSHY_EMULATOR_OS_CLOUD')
         if os_cloud:
@@ -177,18 +286,15 @@ class Application(flask.Flask):
                                              self.systems)
         return vmddriver.StaticDriver(self.config, self.logger)
 
-    @property
-    @memoize.memoize()
+    @functools.cached_property
     def storage(self):
         return stgdriver.StaticDriver(self.config, self.logger)
 
-    @property
-    @memoize.memoize()
+    @functools.cached_property
     def drives(self):
         return drvdriver.StaticDriver(self.config, self.logger)
 
-    @property
-    @memoize.memoize()
+    @functools.cached_property
     def volumes(self):
         return voldriver.StaticDriver(self.config, self.logger)
 
@@ -199,6 +305,29 @@ app.register_blueprint(vmctl.virtual_media)
 app.register_blueprint(usctl.update_service)
 
 
+# Endpoints serving documents that never change while the emulator runs
+_STATIC_ENDPOINTS = frozenset([
+    'registry_file_collection',
+    'bios_attribute_registry_file',
+    'message_registry_file',
+    'bios_registry',
+    'message_registry',
+])
+
+
+@app.after_request
+def add_cache_headers(response):
+    if (flask.request.method in ('GET', 'HEAD')
+            and response.status_code in (200, 304)):
+        if flask.request.endpoint in _STATIC_ENDPOINTS:
+            cache_control = 'public, max-age=86400'
+        else:
+            cache_control = 'max-age=1'
+        response.headers.setdefault('Cache-Control', cache_control)
+
+    return response
+
+
 @app.errorhandler(Exception)
 @api_utils.returns_json
 def all_exception_handler(message):
@@ -221,7 +350,7 @@ def all_exception_handler(message):
 @app.route('/redfish/v1/')
 @api_utils.returns_json
 def root_resource():
-    return app.render_template('root.json')
+    return app.render_cached_template('root.json')
 
 
 @app.route('/redfish/v1/Chassis')
@@ -232,7 +361,7 @@ def chassis_collection_resource():
 
     app.logger.debug('Serving chassis list')
 
-    return app.render_template(
+    return app.render_cached_template(
         'chassis_collection.json',
         manager_count=len(app.chassis.chassis),
         chassis=app.chassis.chassis)
@@ -328,28 +457,46 @@ def manager_collection_resource():
 
     app.logger.debug('Serving managers list')
 
-    return app.render_template(
+    return app.render_cached_template(
         'manager_collection.json',
         manager_count=len(app.managers.managers),
         managers=app.managers.managers)
 
 
-def jsonify(obj_type, obj_version, obj):
-    obj.update({
+@functools.lru_cache()
+def _odata_annotations(obj_type, obj_version):
+    return {
         "@odata.type": "#{0}.{1}.{0}".format(obj_type, obj_version),
         "@odata.context": "/redfish/v1/$metadata#{0}.{0}".format(obj_type),
         "@Redfish.Copyright": ("Copyright 2014-2017 Distributed Management "
                                "Task Force, Inc. (DMTF). For the full DMTF "
                                "copyright policy, see http://www.dmtf.org/"
                                "about/policies/copyright.")
-    })
+    }
+
+
+def jsonify(obj_type, obj_version, obj):
+    obj.update(_odata_annotations(obj_type, obj_version))
     return flask.jsonify(obj)
 
 
+# Manager properties that are the same for all managers, only reported
+# with the full feature set. Only immutable values belong here, as the
+# dict is merged into every response.
+_MANAGER_FULL = {
+    "Description": "Contoso BMC",
+    "Model": "Joo Janta 200",
+    "DateTimeLocalOffset": "+00:00",
+    "PowerState": "On",
+    "FirmwareVersion": "1.00",
+}
+
+
 @app.route('/redfish/v1/Managers/<identity>', methods=['GET'])
 @api_utils.returns_json
 def manager_resource(identity):
-    if app.feature_set == "minimum":
+    feature_set = app.feature_set
+    if feature_set == "minimum":
         raise error.FeatureNotAvailable("Managers")
 
     app.logger.debug('Serving resources for manager "%s"', identity)
@@ -358,6 +505,12 @@ def manager_resource(identity):
     systems = app.managers.get_managed_systems(manager)
     chassis = app.managers.get_managed_chassis(manager)
 
+    if feature_set != "full":
+        chassis = []
+
+    system_path = "/redfish/v1/Systems/{}".format
+    chassis_path = "/redfish/v1/Chassis/{}".format
+
     uuid = manager['UUID']
     result = {
         "Id": manager['Id'],
@@ -369,33 +522,24 @@ def manager_resource(identity):
         },
         "Links": {
             "ManagerForServers": [
-                {
-                    "@odata.id": "/redfish/v1/Systems/%s" % system
-                }
-                for system in systems
+                {"@odata.id": system_path(system)} for system in systems
             ],
             "ManagerForChassis": [
-                {
-                    "@odata.id": "/redfish/v1/Chassis/%s" % ch
-                }
-                for ch in chassis if app.feature_set == "full"
+                {"@odata.id": chassis_path(ch)} for ch in chassis
             ]
         },
         "@odata.id": "/redfish/v1/Managers/%s" % uuid,
     }
-    if app.feature_set == "full":
+    if feature_set == "full":
+        result.update(_MANAGER_FULL)
         result.update({
-            "ServiceEntryPointUUID": manager.get('ServiceEntryPointUUID'),
-            "Description": "Contoso BMC",
-            "Model": "Joo Janta 200",
-            "DateTime": datetime.now().strftime('%Y-%M-%dT%H:%M:%S+00:00'),
-            "DateTimeLocalOffset": "+00:00",
             "Status": {
                 "State": "Enabled",
                 "Health": "OK"
             },
-            "PowerState": "On",
-            "FirmwareVersion": "1.00",
+            "ServiceEntryPointUUID": manager.get('ServiceEntryPointUUID'),
+            "DateTime": datetime.now(timezone.utc).isoformat(
+                timespec='seconds'),
         })
 
     return jsonify('Manager', 'v1_3_1', result)
@@ -409,7 +553,7 @@ def system_collection_resource():
 
     app.logger.debug('Serving systems list')
 
-    return app.render_template(
+    return app.render_cached_template(
         'system_collection.json', system_count=len(systems), systems=systems)
 
 
@@ -437,22 +581,23 @@ def system_resource(identity):
             except error.NotSupportedError:
                 return None
 
+        boot_mode = try_get(app.systems.get_boot_mode)
+
         return app.render_template(
             'system.json',
             identity=identity,
             name=app.systems.name(identity),
-            uuid=app.systems.uuid(identity),
+            uuid=uuid,
             power_state=app.systems.get_power_state(identity),
             total_memory_gb=try_get(app.systems.get_total_memory),
             bios_version=bios_version,
             total_cpus=try_get(app.systems.get_total_cpus),
             boot_source_target=app.systems.get_boot_device(identity),
-            boot_source_mode=try_get(app.systems.get_boot_mode),
-            uefi_mode=(try_get(app.systems.get_boot_mode) == 'UEFI'),
+            boot_source_mode=boot_mode,
+            uefi_mode=(boot_mode == 'UEFI'),
             managers=app.managers.get_managers_for_system(identity),
             chassis=app.chassis.chassis[:1],
-            indicator_led=app.indicators.get_indicator_state(
-                app.systems.uuid(identity)),
+            indicator_led=app.indicators.get_indicator_state(uuid),
             http_boot_uri=try_get(app.systems.get_http_boot_uri)
         )
 
@@ -565,14 +710,10 @@ def ethernet_interface(identity, nic_id):
     if app.feature_set == "minimum":
         raise error.FeatureNotAvailable("EthernetInterfaces")
 
-    nics = app.systems.get_nics(identity)
+    nic = _find_member(app.systems.get_nics(identity), nic_id)
 
-    for nic in nics:
-        if nic['id'] == nic_id:
-            return app.render_template(
-                'ethernet_interface.json', identity=identity, nic=nic)
-
-    raise error.NotFound()
+    return app.render_template(
+        'ethernet_interface.json', identity=identity, nic=nic)
 
 
 @app.route('/redfish/v1/Systems/<identity>/Processors',
@@ -598,14 +739,10 @@ def processor(identity, processor_id):
     if app.feature_set != "full":
         raise error.FeatureNotAvailable("Processors")
 
-    processors = app.systems.get_processors(identity)
-
-    for proc in processors:
-        if proc['id'] == processor_id:
-            return app.render_template(
-                'processor.json', identity=identity, processor=proc)
+    proc = _find_member(app.systems.get_processors(identity), processor_id)
 
-    raise error.NotFound()
+    return app.render_template(
+        'processor.json', identity=identity, processor=proc)
 
 
 @app.route('/redfish/v1/Systems/<identity>/Actions/ComputerSystem.Reset',
@@ -629,6 +766,15 @@ def system_reset_action(identity):
     return '', 204
 
 
+def _dump_attributes(attributes):
+    """Serialize BIOS attributes for embedding into a template."""
+    if orjson is None:
+        return json.dumps(attributes, sort_keys=True, indent=6)
+
+    return orjson.dumps(
+        attributes, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2).decode()
+
+
 @app.route('/redfish/v1/Systems/<identity>/BIOS', methods=['GET'])
 @api_utils.ensure_instance_access
 @api_utils.returns_json
@@ -643,7 +789,7 @@ def bios(identity):
     return app.render_template(
         'bios.json',
         identity=identity,
-        bios_current_attributes=json.dumps(bios, sort_keys=True, indent=6))
+        bios_current_attributes=_dump_attributes(bios))
 
 
 @app.route('/redfish/v1/Systems/<identity>/BIOS/Settings',
@@ -662,7 +808,7 @@ def bios_settings(identity):
         return app.render_template(
             'bios_settings.json',
             identity=identity,
-            bios_pending_attributes=json.dumps(bios, sort_keys=True, indent=6))
+            bios_pending_attributes=_dump_attributes(bios))
 
     elif flask.request.method == 'PATCH':
         attributes = flask.request.json.get('Attributes')
@@ -747,7 +893,8 @@ def simple_storage(identity, simple_storage_id):
     try:
         storage_controller = simple_storage_controllers[simple_storage_id]
     except KeyError:
-        app.logger.debug('"%s" Simple Storage resource was not found')
+        app.logger.debug('"%s" Simple Storage resource was not found',
+                         simple_storage_id)
         raise error.NotFound()
     return app.render_template('simple_storage.json', identity=identity,
                                simple_storage=storage_controller)
@@ -779,14 +926,11 @@ def storage(identity, storage_id):
         raise error.FeatureNotAvailable("Storage")
 
     uuid = app.systems.uuid(identity)
-    storage_col = app.storage.get_storage_col(uuid)
-
-    for stg in storage_col:
-        if stg['Id'] == storage_id:
-            return app.render_template(
-                'storage.json', identity=identity, storage=stg)
+    stg = _find_member(app.storage.get_storage_col(uuid), storage_id,
+                       key='Id')
 
-    raise error.NotFound()
+    return app.render_template(
+        'storage.json', identity=identity, storage=stg)
 
 
 @app.route('/redfish/v1/Systems/<identity>/Storage/<stg_id>/Drives/<drv_id>',
@@ -798,14 +942,10 @@ def drive_resource(identity, stg_id, drv_id):
         raise error.FeatureNotAvailable("Storage")
 
     uuid = app.systems.uuid(identity)
-    drives = app.drives.get_drives(uuid, stg_id)
-
-    for drv in drives:
-        if drv['Id'] == drv_id:
-            return app.render_template(
-                'drive.json', identity=identity, storage_id=stg_id, drive=drv)
+    drv = _find_member(app.drives.get_drives(uuid, stg_id), drv_id, key='Id')
 
-    raise error.NotFound()
+    return app.render_template(
+        'drive.json', identity=identity, storage_id=stg_id, drive=drv)
 
 
 @app.route('/redfish/v1/Systems/<identity>/Storage/<storage_id>/Volumes',
@@ -823,8 +963,8 @@ def volumes_collection(identity, storage_id):
         vol_col = app.volumes.get_volumes_col(uuid, storage_id)
 
         vol_ids = []
-        for vol in vol_col:
-            vol_id = app.systems.find_or_create_storage_volume(vol)
+        for vol, vol_id in zip(
+                vol_col, app.systems.find_or_create_storage_volumes(vol_col)):
             if not vol_id:
                 app.volumes.delete_volume(uuid, storage_id, vol)
             else:
@@ -885,8 +1025,7 @@ def registry_file_collection():
 
     app.logger.debug('Serving registry file collection')
 
-    return app.render_template(
-        'registry_file_collection.json')
+    return app.render_cached_template('registry_file_collection.json')
 
 
 @app.route('/redfish/v1/Registries/BiosAttributeRegistry.v1_0_0')
@@ -897,8 +1036,7 @@ def bios_attribute_registry_file():
 
     app.logger.debug('Serving BIOS attribute registry file')
 
-    return app.render_template(
-        'bios_attribute_registry_file.json')
+    return app.render_cached_template('bios_attribute_registry_file.json')
 
 
 @app.route('/redfish/v1/Registries/Messages')
@@ -909,8 +1047,7 @@ def message_registry_file():
 
     app.logger.debug('Serving message registry file')
 
-    return app.render_template(
-        'message_registry_file.json')
+    return app.render_cached_template('message_registry_file.json')
 
 
 @app.route('/redfish/v1/Systems/Bios/BiosRegistry')
@@ -921,7 +1058,7 @@ def bios_registry():
 
     app.logger.debug('Serving BIOS registry')
 
-    return app.render_template('bios_registry.json')
+    return app.render_cached_template('bios_registry.json')
 
 
 @app.route('/redfish/v1/Registries/Messages/Registry')
@@ -932,7 +1069,7 @@ def message_registry():
 
     app.logger.debug('Serving message registry')
 
-    return app.render_template('message_registry.json')
+    return app.render_cached_template('message_registry.json')
 
 
 @app.route('/redfish/v1/TaskService',
@@ -1050,6 +1187,8 @@ def main():
     if args.feature_set:
         app.config['SUSHY_EMULATOR_FEATURE_SET'] = args.feature_set
 
+    app.init_resources()
+
     ssl_context = None
     ssl_certificate = app.config.get('SUSHY_EMULATOR_SSL_CERT')
     ssl_key = app.config.get('SUSHY_EMULATOR_SSL_KEY')
@@ -58,7 +58,7 @@ def memoize(permanent_cache=None):
 
             method_cache = cache.setdefault(method, {})
 
-            key = frozenset(args), frozenset(kwargs)
+            key = args, frozenset(kwargs.items())
 
             try:
                 return method_cache[key]
@@ -259,6 +259,20 @@ class AbstractSystemsDriver(metaclass=abc.ABCMeta):
         """
         raise error.NotSupportedError('Not implemented')
 
+    def find_or_create_storage_volumes(self, volumes):
+        """Find/create several volumes in the virtualization backend
+
+        Drivers can override this method to handle all the volumes with
+        fewer calls to the backend.
+
+        :param volumes: list of volume data dicts, as accepted by
+                        `find_or_create_storage_volume`
+
+        :returns: list with the Id of each volume if successfully
+                  found/created else None, in the order of `volumes`
+        """
+        return [self.find_or_create_storage_volume(data) for data in volumes]
+
     def get_http_boot_uri(self, identity):
         """Return the URI stored for the HttpBootUri.
 
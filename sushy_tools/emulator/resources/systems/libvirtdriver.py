@@ -1505,12 +1505,10 @@ class LibvirtDriver(AbstractSystemsDriver):
             try:
                 vol = conn.storageVolLookupByPath(vol_path)
             except libvirt.libvirtError as e:
-                msg = ('Could not find storage volume by path '
-                       '"%(path)s" at libvirt URI "%(uri)s": '
-                       '%(err)s' %
-                       {'path': vol_path, 'uri': self._uri,
-                        'err': e})
-                self._logger.debug(msg)
+                self._logger.debug('Could not find storage volume by path '
+                                   '"%(path)s" at libvirt URI "%(uri)s": '
+                                   '%(err)s', {'path': vol_path,
+                                               'uri': self._uri, 'err': e})
                 return
             disk_device = {
                 'Name': vol.name(),
@@ -1529,21 +1527,20 @@ class LibvirtDriver(AbstractSystemsDriver):
             try:
                 pool = conn.storagePoolLookupByName(pool_name)
             except libvirt.libvirtError as e:
-                msg = ('Error finding Storage Pool by name "%(name)s" at'
-                       'libvirt URI "%(uri)s": %(err)s' %
-                       {'name': pool_name, 'uri': self._uri, 'err': e})
-                self._logger.debug(msg)
+                self._logger.debug('Error finding Storage Pool by name '
+                                   '"%(name)s" at libvirt URI "%(uri)s": '
+                                   '%(err)s', {'name': pool_name,
+                                               'uri': self._uri, 'err': e})
                 return
 
             try:
                 vol = pool.storageVolLookupByName(vol_name)
             except libvirt.libvirtError as e:
-                msg = ('Error finding Storage Volume by name "%(name)s" '
-                       'in Pool '"%(pName)s"' at libvirt URI "%(uri)s"'
-                       ': %(err)s' %
-                       {'name': vol_name, 'pName': pool_name,
-                        'uri': self._uri, 'err': e})
-                self._logger.debug(msg)
+                self._logger.debug('Error finding Storage Volume by name '
+                                   '"%(name)s" in Pool "%(pName)s" at '
+                                   'libvirt URI "%(uri)s": %(err)s',
+                                   {'name': vol_name, 'pName': pool_name,
+                                    'uri': self._uri, 'err': e})
                 return
             disk_device = {
                 'Name': vol.name(),
@@ -1597,53 +1594,106 @@ class LibvirtDriver(AbstractSystemsDriver):
 
         :returns: Id of the volume if successfully found/created else None
         """
+        poolName = data.get('libvirtPoolName', self.STORAGE_POOL)
+
         with libvirt_open(self._uri) as conn:
-            try:
-                poolName = data['libvirtPoolName']
-            except KeyError:
-                poolName = self.STORAGE_POOL
-            try:
-                pool = conn.storagePoolLookupByName(poolName)
-            except libvirt.libvirtError as ex:
-                msg = ('Error finding Storage Pool by name "%(name)s" at '
-                       'libvirt URI "%(uri)s": %(err)s' %
-                       {'name': poolName, 'uri': self._uri, 'err': ex})
-                self._logger.debug(msg)
+            pool = self._get_storage_pool(conn, poolName)
+            if pool is None:
                 return
+
             try:
-                vol = pool.storageVolLookupByName(data['libvirtVolName'])
+                pool.storageVolLookupByName(data['libvirtVolName'])
+
             except libvirt.libvirtError:
+                if not self._create_storage_volume(pool, poolName, data):
+                    return
 
-                msg = ('Creating storage volume with name: "%s"',
-                       data['libvirtVolName'])
-                self._logger.debug(msg)
+            return data['Id']
 
-                pool_tree = ET.fromstring(pool.XMLDesc())
+    def find_or_create_storage_volumes(self, volumes):
+        """Find/create several volumes in the virtualization backend
 
-                # Find out path to the volume
-                pool_path_element = pool_tree.find('target/path')
-                if pool_path_element is None:
-                    msg = ('Missing "target/path" tag in the libvirt '
-                           'storage pool "%(pool)s"'
-                           '' % {'pool': poolName})
-                    self._logger.debug(msg)
-                    return
+        A single libvirt connection is used for all the volumes, and each
+        storage pool is only looked up and listed once.
 
-                vol_path = os.path.join(
-                    pool_path_element.text, data['libvirtVolName'])
+        :param volumes: list of volume data dicts, as accepted by
+                        `find_or_create_storage_volume`
 
-                # Create a new volume
-                vol = pool.createXML(
-                    self.STORAGE_VOLUME_XML % {
-                        'name': data['libvirtVolName'], 'path': vol_path,
-                        'size': data['CapacityBytes']})
+        :returns: list with the Id of each volume if successfully
+                  found/created else None, in the order of `volumes`
+        """
+        pools = {}
+        result = []
 
-                if not vol:
-                    msg = ('Error creating "%s" storage volume in "%s" pool',
-                           data['libvirtVolName'], poolName)
-                    self._logger.debug(msg)
-                    return
-            return data['Id']
+        with libvirt_open(self._uri) as conn:
+            for data in volumes:
+                poolName = data.get('libvirtPoolName', self.STORAGE_POOL)
+                if poolName not in pools:
+                    pool = self._get_storage_pool(conn, poolName)
+                    vol_names = (set(pool.listVolumes())
+                                 if pool is not None else set())
+                    pools[poolName] = pool, vol_names
+
+                pool, vol_names = pools[poolName]
+                if pool is None:
+                    result.append(None)
+                    continue
+
+                if data['libvirtVolName'] not in vol_names:
+                    if not self._create_storage_volume(pool, poolName, data):
+                        result.append(None)
+                        continue
+
+                    vol_names.add(data['libvirtVolName'])
+
+                result.append(data['Id'])
+
+        return result
+
+    def _get_storage_pool(self, conn, poolName):
+        """Look up a storage pool by name
+
+        :returns: the libvirt storage pool or `None` if it is missing
+        """
+        try:
+            return conn.storagePoolLookupByName(poolName)
+
+        except libvirt.libvirtError as ex:
+            self._logger.debug('Error finding Storage Pool by name "%s" at '
+                               'libvirt URI "%s": %s', poolName, self._uri, ex)
+
+    def _create_storage_volume(self, pool, poolName, data):
+        """Create a storage volume in the given pool
+
+        :returns: the new libvirt volume or `None` on failure
+        """
+        self._logger.debug('Creating storage volume with name: "%s"',
+                           data['libvirtVolName'])
+
+        pool_tree = ET.fromstring(pool.XMLDesc())
+
+        # Find out path to the volume
+        pool_path_element = pool_tree.find('target/path')
+        if pool_path_element is None:
+            self._logger.debug('Missing "target/path" tag in the libvirt '
+                               'storage pool "%s"', poolName)
+            return
+
+        vol_path = os.path.join(
+            pool_path_element.text, data['libvirtVolName'])
+
+        # Create a new volume
+        vol = pool.createXML(
+            self.STORAGE_VOLUME_XML % {
+                'name': data['libvirtVolName'], 'path': vol_path,
+                'size': data['CapacityBytes']})
+
+        if not vol:
+            self._logger.debug('Error creating "%s" storage volume in "%s" '
+                               'pool', data['libvirtVolName'], poolName)
+            return
+
+        return vol
 
     def get_http_boot_uri(self, identity):
         """Return the URI stored for the HttpBootUri.
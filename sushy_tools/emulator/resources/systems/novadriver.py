@@ -202,7 +202,7 @@ class OpenStackDriver(AbstractSystemsDriver):
 
         if delayed_media_eject:
             self._logger.debug(
-                'Create task to rebuild with blank-image for %(identity)s' %
+                'Create task to rebuild with blank-image for %(identity)s',
                 {'identity': identity})
             # Not running async here, as long as the blank image used is small
             # this should finish in ~20 seconds.
@@ -455,22 +455,22 @@ class OpenStackDriver(AbstractSystemsDriver):
         instance_image = self._get_instance_image_id(instance)
 
         if instance_image == boot_image:
-            msg = ('Image %(identity)s already has image %(boot_image)s. '
-                   'Skipping rebuild.' % {'identity': identity,
-                                          'boot_image': boot_image})
-            self._logger.debug(msg)
+            self._logger.debug(
+                'Image %(identity)s already has image %(boot_image)s. '
+                'Skipping rebuild.', {'identity': identity,
+                                      'boot_image': boot_image})
 
         elif boot_image is None:
             if self._config.get('SUSHY_EMULATOR_OS_VMEDIA_DELAY_EJECT', True):
                 self._logger.debug(
                     'Set instance metadata for vmedia eject on next power '
-                    'action for %(identity)s' % {'identity': identity})
+                    'action for %(identity)s', {'identity': identity})
                 server_metadata = {'sushy-tools-delay-eject': 'true'}
                 self._cc.set_server_metadata(identity, server_metadata)
             else:
                 self._logger.debug(
                     'Create task to rebuild with blank-image for '
-                    '%(identity)s' % {'identity': identity})
+                    '%(identity)s', {'identity': identity})
                 # Not running async here, as long as the blank image used is
                 # small this should finish in ~20 seconds.
                 self._submit_future(
@@ -484,14 +484,14 @@ class OpenStackDriver(AbstractSystemsDriver):
                 self._remove_delayed_eject_metadata(identity)
 
             self._logger.debug(
-                'Creating task to finish import and rebuild for %(identity)s' %
+                'Creating task to finish import and rebuild for %(identity)s',
                 {'identity': identity})
             self._submit_future(
                 True, self._rebuild_with_imported_image, identity, boot_image)
 
     def insert_image(self, identity, image_url, local_file_path=None):
         self._logger.debug(
-            'Creating task to insert image for %(identity)s' %
+            'Creating task to insert image for %(identity)s',
             {'identity': identity})
         return self._submit_future(
             False, self._insert_image, identity, image_url, local_file_path)
@@ -512,7 +512,7 @@ class OpenStackDriver(AbstractSystemsDriver):
 
         if boot_mode == 'UEFI':
             self._logger.debug('Setting UEFI image properties for '
-                               '%(identity)s' % {'identity': identity})
+                               '%(identity)s', {'identity': identity})
             image_attrs['properties'] = {
                 'hw_firmware_type': 'uefi',
                 'hw_machine_type': 'q35'
@@ -531,12 +531,12 @@ class OpenStackDriver(AbstractSystemsDriver):
             if local_file_path:
                 self._logger.debug(
                     'Uploading image file %(file)s from source %(url)s '
-                    'for %(identity)s' % {'identity': identity,
-                                          'file': local_file_path,
-                                          'url': image_url})
+                    'for %(identity)s', {'identity': identity,
+                                         'file': local_file_path,
+                                         'url': image_url})
             else:
                 self._logger.debug(
-                    'Importing image %(url)s for %(identity)s' %
+                    'Importing image %(url)s for %(identity)s',
                     {'identity': identity, 'url': image_url})
                 self._cc.image.import_image(image, method='web-download',
                                             uri=image_url)
@@ -559,7 +559,7 @@ class OpenStackDriver(AbstractSystemsDriver):
 
     def eject_image(self, identity):
         self._logger.debug(
-            'Creating task to eject image for %(identity)s' %
+            'Creating task to eject image for %(identity)s',
             {'identity': identity})
         self._submit_future(False, self._eject_image, identity)
 
@@ -595,14 +595,14 @@ class OpenStackDriver(AbstractSystemsDriver):
                                          *metadata_keys):
         if image:
             try:
-                self._logger.debug('Deleting image %(image)s' %
+                self._logger.debug('Deleting image %(image)s',
                                    {'image': image})
                 self._cc.delete_image(image)
             except Exception:
                 pass
         if local_file:
             try:
-                self._logger.debug('Deleting local file %(local_file)s' %
+                self._logger.debug('Deleting local file %(local_file)s',
                                    {'local_file': local_file})
                 self._delete_local_file(local_file)
             except Exception:
@@ -660,7 +660,7 @@ class OpenStackDriver(AbstractSystemsDriver):
                                        image.status)
 
             self._logger.debug(
-                'Rebuilding %(identity)s with image %(image)s' %
+                'Rebuilding %(identity)s with image %(image)s',
                 {'identity': identity, 'image': image.id})
             server = self._cc.compute.rebuild_server(identity, image.id)
             while server.status == 'REBUILD':
@@ -670,7 +670,7 @@ class OpenStackDriver(AbstractSystemsDriver):
                 raise error.FishyError('Server rebuild attempt resulted in '
                                        'status %s' % server.status)
             self._logger.debug(
-                'Rebuild %(identity)s complete' % {'identity': identity})
+                'Rebuild %(identity)s complete', {'identity': identity})
 
         except Exception as ex:
             msg = 'Failed insert image from URL %s: %s' % (image_url, ex)
@@ -702,7 +702,7 @@ class OpenStackDriver(AbstractSystemsDriver):
                 raise error.FishyError(msg)
 
             self._logger.debug(
-                'Rebuilding %(identity)s with image %(image)s' %
+                'Rebuilding %(identity)s with image %(image)s',
                 {'identity': identity, 'image': image.id})
             server = self._cc.compute.rebuild_server(identity, image.id)
 
@@ -713,7 +713,7 @@ class OpenStackDriver(AbstractSystemsDriver):
                 raise error.FishyError('Server rebuild attempt resulted in '
                                        'status %s' % server.status)
             self._logger.debug(
-                'Rebuild %(identity)s complete' % {'identity': identity})
+                'Rebuild %(identity)s complete', {'identity': identity})
 
         except Exception as ex:
             msg = 'Failed ejecting image %s: %s' % (image_url, ex)
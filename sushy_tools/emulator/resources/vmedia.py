@@ -341,8 +341,8 @@ class StaticDriver(BaseDriver):
             image_url, auth, verify_media_cert, custom_cert)
 
         self._logger.debug(
-            'Fetched image %(url)s for %(identity)s' % {
-                'identity': identity, 'url': image_url})
+            'Fetched image %(url)s for %(identity)s',
+            {'identity': identity, 'url': image_url})
 
         device_info['Image'] = image_url
         device_info['ImageName'] = local_file
@@ -380,8 +380,8 @@ class StaticDriver(BaseDriver):
                 os.unlink(local_file)
 
                 self._logger.debug(
-                    'Removed local file %(file)s for %(identity)s' % {
-                        'identity': identity, 'file': local_file})
+                    'Removed local file %(file)s for %(identity)s',
+                    {'identity': identity, 'file': local_file})
             except FileNotFoundError:
                 # Ignore error as we are trying to remove the file anyway
                 pass
@@ -446,8 +446,8 @@ class OpenstackDriver(BaseDriver):
         local_file_path = None
         if self._config.get(
                 'SUSHY_EMULATOR_OS_VMEDIA_IMAGE_FILE_UPLOAD', False):
-            self._logger.debug('Downloading image for %(identity)s'
-                               % {'identity': identity})
+            self._logger.debug('Downloading image for %(identity)s',
+                               {'identity': identity})
             _, local_file_path = self._get_image(
                 image_url, auth, verify_media_cert, None)
 
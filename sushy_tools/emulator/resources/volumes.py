@@ -49,9 +49,9 @@ class StaticDriver(base.DriverBase):
             return self._volumes[(uu_identity, storage_id)]
 
         except (KeyError, ValueError):
-            msg = ('Error finding volume collection by System UUID %s '
-                   'and Storage ID %s' % (uu_identity, storage_id))
-            self._logger.debug(msg)
+            self._logger.debug('Error finding volume collection by System '
+                               'UUID %s and Storage ID %s', identity,
+                               storage_id)
 
     def add_volume(self, uu_identity, storage_id, vol):
         if not self._volumes[(uu_identity, storage_id)]:
@@ -65,9 +65,9 @@ class StaticDriver(base.DriverBase):
         try:
             vol_col = self._volumes[(uu_identity, storage_id)]
         except KeyError:
-            msg = ('Error finding volume collection by System UUID %s '
-                   'and Storage ID %s' % (uu_identity, storage_id))
-            self._logger.debug(msg)
+            self._logger.debug('Error finding volume collection by System '
+                               'UUID %s and Storage ID %s', uu_identity,
+                               storage_id)
         else:
             vol_col.remove(vol)
             self._volumes.update({(uu_identity, storage_id): vol_col})
@@ -25,4 +25,4 @@ class TestCase(base.BaseTestCase):
 
     def setUp(self):
         super().setUp()
-        main.app._cache = {}
+        main.app.reset_resources()
@@ -36,7 +36,7 @@ class VirtualMediaTestCase(test_main.EmulatorTestCase):
             [m['@odata.id'] for m in response.json['Members']])
 
     def test_virtual_media_collection_empty(self, systems_mock, vmedia_mock):
-        vmedia_mock.return_value.get_devices.return_value = []
+        vmedia_mock.return_value.devices = []
 
         response = self.app.get(
             'redfish/v1/Systems/' + self.uuid + '/VirtualMedia')
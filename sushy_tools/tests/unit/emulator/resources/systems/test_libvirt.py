@@ -1364,9 +1364,117 @@ class LibvirtDriverTestCase(base.BaseTestCase):
             'Storage volume not found')
         pool_mock.XMLDesc.return_value = data
 
-        self.test_driver.find_or_create_storage_volume(vol_data)
+        self.assertEqual(
+            '1', self.test_driver.find_or_create_storage_volume(vol_data))
+        pool_mock.storageVolLookupByName.assert_called_once_with('123456')
+        pool_mock.listVolumes.assert_not_called()
         pool_mock.createXML.assert_called_once_with(mock.ANY)
 
+    @mock.patch('libvirt.open', autospec=True)
+    def test_find_or_create_storage_volume_existing(self, libvirt_mock):
+        conn_mock = libvirt_mock.return_value
+        vol_data = {
+            "libvirtVolName": "123456",
+            "Id": "1",
+            "Name": "Sample Vol",
+            "CapacityBytes": 12345,
+            "VolumeType": "Mirrored"
+        }
+        pool_mock = conn_mock.storagePoolLookupByName.return_value
+
+        self.assertEqual(
+            '1', self.test_driver.find_or_create_storage_volume(vol_data))
+        pool_mock.storageVolLookupByName.assert_called_once_with('123456')
+        pool_mock.createXML.assert_not_called()
+
+    @mock.patch('libvirt.open', autospec=True)
+    def test_find_or_create_storage_volume_no_pool(self, libvirt_mock):
+        conn_mock = libvirt_mock.return_value
+        vol_data = {
+            "libvirtVolName": "123456",
+            "Id": "1",
+            "Name": "Sample Vol",
+            "CapacityBytes": 12345,
+            "VolumeType": "Mirrored"
+        }
+        conn_mock.storagePoolLookupByName.side_effect = libvirt.libvirtError(
+            'Storage pool not found')
+
+        self.assertIsNone(
+            self.test_driver.find_or_create_storage_volume(vol_data))
+
+    @mock.patch('libvirt.open', autospec=True)
+    def test_find_or_create_storage_volumes(self, libvirt_mock):
+        conn_mock = libvirt_mock.return_value
+        vols_data = [
+            {
+                "libvirtVolName": "123456",
+                "Id": "1",
+                "Name": "Existing Vol",
+                "CapacityBytes": 12345,
+                "VolumeType": "Mirrored"
+            },
+            {
+                "libvirtVolName": "654321",
+                "Id": "2",
+                "Name": "New Vol",
+                "CapacityBytes": 12345,
+                "VolumeType": "Mirrored"
+            },
+            {
+                "libvirtPoolName": "missing",
+                "libvirtVolName": "000000",
+                "Id": "3",
+                "Name": "Orphan Vol",
+                "CapacityBytes": 12345,
+                "VolumeType": "Mirrored"
+            }
+        ]
+
+        pool_mock = mock.Mock()
+        pool_mock.listVolumes.return_value = ['123456']
+        with open('sushy_tools/tests/unit/emulator/pool.xml', 'r') as f:
+            pool_mock.XMLDesc.return_value = f.read()
+
+        def lookup_pool(name):
+            if name == 'missing':
+                raise libvirt.libvirtError('Storage pool not found')
+            return pool_mock
+
+        conn_mock.storagePoolLookupByName.side_effect = lookup_pool
+
+        self.assertEqual(
+            ['1', '2', None],
+            self.test_driver.find_or_create_storage_volumes(vols_data))
+
+        libvirt_mock.assert_called_once_with(self.test_driver._uri)
+        self.assertEqual(
+            [mock.call('default'), mock.call('missing')],
+            conn_mock.storagePoolLookupByName.call_args_list)
+        pool_mock.listVolumes.assert_called_once_with()
+        pool_mock.createXML.assert_called_once_with(mock.ANY)
+
+    @mock.patch('libvirt.open', autospec=True)
+    def test_find_or_create_storage_volumes_list_fails(self, libvirt_mock):
+        conn_mock = libvirt_mock.return_value
+        vols_data = [{
+            "libvirtVolName": "123456",
+            "Id": "1",
+            "Name": "Sample Vol",
+            "CapacityBytes": 12345,
+            "VolumeType": "Mirrored"
+        }]
+        pool_mock = conn_mock.storagePoolLookupByName.return_value
+        pool_mock.listVolumes.side_effect = libvirt.libvirtError(
+            'Storage pool is not active')
+
+        # A pool that exists but cannot be listed is an error, it must not
+        # be reported as a missing volume
+        self.assertRaises(
+            libvirt.libvirtError,
+            self.test_driver.find_or_create_storage_volumes, vols_data)
+        pool_mock.createXML.assert_not_called()
+
     @mock.patch('libvirt.openReadOnly', autospec=True)
     def test_get_secure_boot_off(self, libvirt_mock):
         with open('sushy_tools/tests/unit/emulator/domain-q35_uefi.xml',
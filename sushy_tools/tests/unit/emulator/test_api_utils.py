@@ -24,26 +24,20 @@ class InstanceDeniedTestCase(test_main.EmulatorTestCase):
         ctx = main.app.app_context().__enter__()
         self.addCleanup(lambda: ctx.__exit__(None, None, None))
 
-    @mock.patch.dict(main.app.config, {}, clear=True)
-    def test_instance_denied_allow_all(self):
-        self.assertFalse(api_utils.instance_denied(identity='x'))
-
-    @mock.patch.dict(
-        main.app.config, {'SUSHY_EMULATOR_ALLOWED_INSTANCES': {}})
-    def test_instance_denied_disallow_all(self):
-        self.assertTrue(api_utils.instance_denied(identity='a'))
-
-    def test_instance_denied_undefined_option(self):
-        with mock.patch.dict(main.app.config):
-            main.app.config.pop('SUSHY_EMULATOR_ALLOWED_INSTANCES', None)
-            self.assertFalse(api_utils.instance_denied(identity='a'))
-
-    @mock.patch.dict(
-        main.app.config, {'SUSHY_EMULATOR_ALLOWED_INSTANCES': {'a'}})
-    def test_instance_denied_allow_some(self):
-        self.assertFalse(api_utils.instance_denied(identity='a'))
-
-    @mock.patch.dict(
-        main.app.config, {'SUSHY_EMULATOR_ALLOWED_INSTANCES': {'a'}})
-    def test_instance_denied_disallow_some(self):
-        self.assertTrue(api_utils.instance_denied(identity='b'))
+    def test_instance_denied(self):
+        allowed = 'SUSHY_EMULATOR_ALLOWED_INSTANCES'
+        cases = [
+            # option undefined, everything is allowed
+            ({}, 'a', False),
+            ({allowed: {}}, 'a', True),
+            ({allowed: {'a'}}, 'a', False),
+            ({allowed: {'a'}}, 'b', True),
+        ]
+
+        for config, identity, expected in cases:
+            with self.subTest(config=config, identity=identity):
+                with mock.patch.dict(main.app.config):
+                    main.app.config.pop(allowed, None)
+                    main.app.config.update(config)
+                    self.assertIs(expected,
+                                  api_utils.instance_denied(identity=identity))
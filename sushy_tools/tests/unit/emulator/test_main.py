@@ -10,6 +10,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from datetime import datetime
+from datetime import timezone
 import tempfile
 from unittest import mock
 
@@ -19,10 +21,16 @@ from sushy_tools.emulator import main
 from sushy_tools import error
 
 
+def _resource_mock():
+    # Drivers are only ever called, never used as containers or context
+    # managers, so a plain Mock is enough and much cheaper than MagicMock
+    return mock.PropertyMock(return_value=mock.Mock())
+
+
 def patch_resource(name):
     def decorator(func):
         return mock.patch.object(main.Application, name,
-                                 new_callable=mock.PropertyMock)(func)
+                                 new_callable=_resource_mock)(func)
     return decorator
 
 
@@ -30,11 +38,27 @@ class EmulatorTestCase(base.BaseTestCase):
 
     name = 'QEmu-fedora-i686'
     uuid = 'c7a5fdbd-cdaf-9455-926a-d65c16db1809'
+    system_url = '/redfish/v1/Systems/' + uuid
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The application is a module level singleton and the tests keep
+        # no client state (e.g. cookies), so one client serves them all
+        cls.app = main.app.test_client()
 
     def setUp(self):
-        self.app = main.app.test_client()
+        super().setUp()
+        # Error path tests would otherwise log full tracebacks. These are
+        # patched per test since oslotest stops all patchers after each one
+        for patcher in (mock.patch.dict(main.app.config, {'TESTING': True}),
+                        mock.patch.object(main.app.logger, 'disabled', True)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
-        super(EmulatorTestCase, self).setUp()
+        # Drivers and rendered templates cached by the shared application
+        # may hold on to mocks, do not let them outlive the test
+        self.addCleanup(main.app.configure)
 
     def set_feature_set(self, new_feature_set):
         main.app.config['SUSHY_EMULATOR_FEATURE_SET'] = new_feature_set
@@ -49,15 +73,125 @@ class CommonTestCase(EmulatorTestCase):
     def test_error(self, systems_mock):
         systems_mock.return_value.get_power_state.side_effect = Exception(
             'Fish is dead')
-        response = self.app.get('/redfish/v1/Systems/' + self.uuid)
+        response = self.app.get(self.system_url)
 
         self.assertEqual(500, response.status_code)
 
+    @mock.patch.object(main.chsdriver, 'StaticDriver', autospec=True)
+    def test_resources_cached(self, driver_mock):
+        main.app.reset_resources()
+        driver_mock.return_value.chassis = ['chassis0']
+
+        for _ in range(2):
+            response = self.app.get('/redfish/v1/Chassis')
+            self.assertEqual(200, response.status_code)
+
+        driver_mock.assert_called_once_with(main.app.config, main.app.logger)
+
+    @mock.patch.dict(main.app.config)
+    @mock.patch.object(main.chsdriver, 'StaticDriver', autospec=True)
+    def test_configure_resets_resources(self, driver_mock):
+        main.app.reset_resources()
+        main.app.chassis
+
+        main.app.configure(extra_config={'SUSHY_EMULATOR_CHASSIS': []})
+        main.app.chassis
+
+        self.assertEqual(2, driver_mock.call_count)
+
+    def test_json_provider(self):
+        self.assertIsInstance(main.app.json, main.JSONProvider)
+        obj = {'b': [1, None], 'a': {'c': True}}
+        expected = '{"a":{"c":true},"b":[1,null]}'
+
+        # orjson is a test requirement, so both code paths are exercised
+        with mock.patch.object(main.orjson, 'dumps',
+                               wraps=main.orjson.dumps) as dumps_mock, \
+                mock.patch.object(main.orjson, 'loads',
+                                  wraps=main.orjson.loads) as loads_mock:
+            self.assertEqual(expected, main.app.json.dumps(obj))
+            self.assertEqual(obj, main.app.json.loads(expected))
+            self.assertEqual(obj, main.app.json.loads(expected.encode()))
+
+        dumps_mock.assert_called_once_with(
+            obj, default=mock.ANY,
+            option=main.orjson.OPT_NON_STR_KEYS | main.orjson.OPT_SORT_KEYS)
+        self.assertEqual(2, loads_mock.call_count)
+
+        self.assertEqual('{\n  "a": 1\n}',
+                         main.app.json.dumps({'a': 1}, indent=2))
+
+    @mock.patch.object(main, 'orjson', None)
+    def test_json_provider_stdlib(self):
+        obj = {'b': [1, None], 'a': {'c': True}}
+        expected = '{"a": {"c": true}, "b": [1, null]}'
+
+        self.assertEqual(expected, main.app.json.dumps(obj))
+        self.assertEqual(obj, main.app.json.loads(expected))
+        self.assertEqual(obj, main.app.json.loads(expected.encode()))
+
+    def test_templates_not_reloaded(self):
+        app = main.Application()
+        app.debug = True
+        self.assertFalse(app.jinja_env.auto_reload)
+
+    def test_init_resources(self):
+        resource_mocks = []
+        for name in main.Application.RESOURCES:
+            patcher = mock.patch.object(main.Application, name,
+                                        new_callable=mock.PropertyMock)
+            resource_mocks.append(patcher.start())
+            self.addCleanup(patcher.stop)
+
+        main.app.init_resources()
+
+        for resource_mock in resource_mocks:
+            resource_mock.assert_called_once_with()
+
+    @mock.patch.dict(main.app.config, {'SUSHY_EMULATOR_FAKE_DRIVER': True})
+    def test_systems_fake_driver(self):
+        main.app.reset_resources()
+
+        self.assertEqual('FakeDriver', type(main.app.systems).__name__)
+
     def test_root_resource(self):
         response = self.app.get('/redfish/v1/')
         self.assertEqual(200, response.status_code)
         self.assertEqual('RedvirtService', response.json['Id'])
 
+    def test_root_resource_not_modified(self):
+        response = self.app.get('/redfish/v1/')
+        self.assertEqual(200, response.status_code)
+        etag = response.headers['ETag']
+
+        response = self.app.get('/redfish/v1/',
+                                headers={'If-None-Match': etag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b'', response.data)
+
+        self.set_feature_set("minimum")
+        response = self.app.get('/redfish/v1/',
+                                headers={'If-None-Match': etag})
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.headers['ETag'])
+
+    def test_root_resource_head(self):
+        response = self.app.head('/redfish/v1/')
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn('ETag', response.headers)
+
+    def test_cache_control(self):
+        response = self.app.get('/redfish/v1/')
+        self.assertEqual('max-age=1', response.headers['Cache-Control'])
+
+        response = self.app.get('/redfish/v1/Registries/Messages')
+        self.assertEqual('public, max-age=86400',
+                         response.headers['Cache-Control'])
+
+        response = self.app.get('/redfish/v1/Nothing')
+        self.assertEqual(404, response.status_code)
+        self.assertNotIn('Cache-Control', response.headers)
+
     def test_root_resource_only_vmedia(self):
         self.set_feature_set("vmedia")
         response = self.app.get('/redfish/v1/')
@@ -93,9 +227,11 @@ class AuthenticatedTestCase(base.BaseTestCase):
         self.app = app.test_client()
 
     def test_root_resource(self):
-        response = self.app.get('/redfish/v1/')
-        # 404 because this application does not have any routes
-        self.assertEqual(404, response.status_code, response.data)
+        for path in ('/', '/redfish', '/redfish/', '/redfish/v1',
+                     '/redfish/v1/'):
+            response = self.app.get(path)
+            # 404 because this application does not have any routes
+            self.assertEqual(404, response.status_code, response.data)
 
     def test_authenticated_resource(self):
         response = self.app.get('/redfish/v1/Systems/',
@@ -106,6 +242,16 @@ class AuthenticatedTestCase(base.BaseTestCase):
         response = self.app.get('/redfish/v1/Systems/')
         self.assertEqual(401, response.status_code, response.data)
 
+    def test_authentication_required_repeated_slashes(self):
+        for path in ('//', '//redfish', '/redfish//', '//redfish/v1',
+                     '/redfish/v1//'):
+            with self.subTest(path=path):
+                # Set PATH_INFO directly, the test client would take the
+                # leading '//' for a network location
+                response = self.app.get(
+                    '/', environ_overrides={'PATH_INFO': path})
+                self.assertEqual(401, response.status_code, response.data)
+
 
 class ChassisTestCase(EmulatorTestCase):
 
@@ -201,8 +347,7 @@ class ManagersTestCase(EmulatorTestCase):
 
     @patch_resource('managers')
     def test_manager_collection_resource(self, managers_mock):
-        type(managers_mock.return_value).managers = mock.PropertyMock(
-            return_value=['bmc0', 'bmc1'])
+        managers_mock.return_value.managers = ['bmc0', 'bmc1']
         response = self.app.get('/redfish/v1/Managers')
         self.assertEqual(200, response.status_code)
         self.assertEqual({'@odata.id': '/redfish/v1/Managers/bmc0'},
@@ -223,17 +368,45 @@ class ManagersTestCase(EmulatorTestCase):
         managers_mock.get_managed_chassis.return_value = ['chassis0']
 
         response = self.app.get('/redfish/v1/Managers/xxxx-yyyy-zzzz')
+        body = response.json
 
-        self.assertEqual(200, response.status_code, response.json)
-        self.assertEqual('xxxx-yyyy-zzzz', response.json['Id'])
-        self.assertEqual('xxxx-yyyy-zzzz', response.json['UUID'])
-        self.assertIsNone(response.json['ServiceEntryPointUUID'])
+        self.assertEqual(200, response.status_code, body)
+        self.assertEqual('xxxx-yyyy-zzzz', body['Id'])
+        self.assertEqual('xxxx-yyyy-zzzz', body['UUID'])
+        self.assertIsNone(body['ServiceEntryPointUUID'])
         self.assertEqual([{'@odata.id': '/redfish/v1/Systems/xxx'}],
-                         response.json['Links']['ManagerForServers'])
+                         body['Links']['ManagerForServers'])
         self.assertEqual([{'@odata.id': '/redfish/v1/Chassis/chassis0'}],
-                         response.json['Links']['ManagerForChassis'])
+                         body['Links']['ManagerForChassis'])
         self.assertEqual({'@odata.id': '/redfish/v1/Systems/xxx/VirtualMedia'},
-                         response.json['VirtualMedia'])
+                         body['VirtualMedia'])
+        self.assertEqual('Contoso BMC', body['Description'])
+        self.assertEqual({'State': 'Enabled', 'Health': 'OK'},
+                         body['Status'])
+        date_time = datetime.fromisoformat(body['DateTime'])
+        self.assertEqual(timezone.utc, date_time.tzinfo)
+        self.assertLess(
+            abs(datetime.now(timezone.utc) - date_time).total_seconds(), 60)
+
+    @mock.patch.object(main, 'orjson', None)
+    @patch_resource('managers')
+    def test_manager_resource_get_stdlib_json(self, managers_mock):
+        managers_mock = managers_mock.return_value
+        managers_mock.get_manager.return_value = {
+            'UUID': 'xxxx-yyyy-zzzz',
+            'Name': 'name',
+            'Id': 'xxxx-yyyy-zzzz',
+        }
+        managers_mock.get_managed_systems.return_value = ['xxx']
+        managers_mock.get_managed_chassis.return_value = ['chassis0']
+
+        response = self.app.get('/redfish/v1/Managers/xxxx-yyyy-zzzz')
+        body = response.json
+
+        self.assertEqual(200, response.status_code, body)
+        self.assertEqual('xxxx-yyyy-zzzz', body['Id'])
+        self.assertEqual('#Manager.v1_3_1.Manager',
+                         body['@odata.type'])
 
     @patch_resource('managers')
     def test_manager_resource_get_reduced_feature_set(self, managers_mock):
@@ -249,24 +422,24 @@ class ManagersTestCase(EmulatorTestCase):
         managers_mock.get_managed_chassis.return_value = ['chassis0']
 
         response = self.app.get('/redfish/v1/Managers/xxxx-yyyy-zzzz')
+        body = response.json
 
-        self.assertEqual(200, response.status_code, response.json)
-        self.assertEqual('xxxx-yyyy-zzzz', response.json['Id'])
-        self.assertEqual('xxxx-yyyy-zzzz', response.json['UUID'])
-        self.assertNotIn('ServiceEntryPointUUID', response.json)
+        self.assertEqual(200, response.status_code, body)
+        self.assertEqual('xxxx-yyyy-zzzz', body['Id'])
+        self.assertEqual('xxxx-yyyy-zzzz', body['UUID'])
+        self.assertNotIn('ServiceEntryPointUUID', body)
         self.assertEqual([{'@odata.id': '/redfish/v1/Systems/xxx'}],
-                         response.json['Links']['ManagerForServers'])
-        self.assertNotIn('Chassis', response.json['Links'])
+                         body['Links']['ManagerForServers'])
+        self.assertNotIn('Chassis', body['Links'])
         self.assertEqual({'@odata.id': '/redfish/v1/Systems/xxx/VirtualMedia'},
-                         response.json['VirtualMedia'])
+                         body['VirtualMedia'])
 
 
 class SystemsTestCase(EmulatorTestCase):
 
     @patch_resource('systems')
     def test_system_collection_resource(self, systems_mock):
-        type(systems_mock.return_value).systems = mock.PropertyMock(
-            return_value=['host0', 'host1'])
+        systems_mock.return_value.systems = ['host0', 'host1']
         response = self.app.get('/redfish/v1/Systems')
         self.assertEqual(200, response.status_code)
         self.assertEqual({'@odata.id': '/redfish/v1/Systems/host0'},
@@ -274,6 +447,24 @@ class SystemsTestCase(EmulatorTestCase):
         self.assertEqual({'@odata.id': '/redfish/v1/Systems/host1'},
                          response.json['Members'][1])
 
+    @patch_resource('systems')
+    def test_system_collection_resource_cached(self, systems_mock):
+        main.app.configure()
+        systems_mock = systems_mock.return_value
+        systems_mock.systems = ['host0']
+
+        with mock.patch.object(main.app, 'render_template',
+                               wraps=main.app.render_template) as render_mock:
+            self.app.get('/redfish/v1/Systems')
+            response = self.app.get('/redfish/v1/Systems')
+            self.assertEqual(1, response.json['Members@odata.count'])
+            self.assertEqual(1, render_mock.call_count)
+
+            systems_mock.systems = ['host0', 'host1']
+            response = self.app.get('/redfish/v1/Systems')
+            self.assertEqual(2, response.json['Members@odata.count'])
+            self.assertEqual(2, render_mock.call_count)
+
     @patch_resource('indicators')
     @patch_resource('chassis')
     @patch_resource('managers')
@@ -290,31 +481,75 @@ class SystemsTestCase(EmulatorTestCase):
         managers_mock.return_value.get_managers_for_system.return_value = [
             'aaaa-bbbb-cccc']
         chassis_mock.return_value.chassis = ['chassis0']
-        indicators_mock.return_value.get_indicator_state.return_value = 'Off'
+        get_indicator_state = indicators_mock.return_value.get_indicator_state
+        get_indicator_state.return_value = 'Off'
 
         response = self.app.get('/redfish/v1/Systems/xxxx-yyyy-zzzz')
+        body = response.json
 
         self.assertEqual(200, response.status_code)
-        self.assertEqual('xxxx-yyyy-zzzz', response.json['Id'])
-        self.assertEqual('zzzz-yyyy-xxxx', response.json['UUID'])
-        self.assertEqual('On', response.json['PowerState'])
-        self.assertEqual('Off', response.json['IndicatorLED'])
+        self.assertEqual('xxxx-yyyy-zzzz', body['Id'])
+        self.assertEqual('zzzz-yyyy-xxxx', body['UUID'])
+        self.assertEqual('On', body['PowerState'])
+        self.assertEqual('Off', body['IndicatorLED'])
         self.assertEqual(
-            1, response.json['MemorySummary']['TotalSystemMemoryGiB'])
-        self.assertEqual(2, response.json['ProcessorSummary']['Count'])
+            1, body['MemorySummary']['TotalSystemMemoryGiB'])
+        self.assertEqual(2, body['ProcessorSummary']['Count'])
         self.assertEqual(
-            'Cd', response.json['Boot']['BootSourceOverrideTarget'])
+            'Cd', body['Boot']['BootSourceOverrideTarget'])
         self.assertEqual(
-            'Legacy', response.json['Boot']['BootSourceOverrideMode'])
+            'Legacy', body['Boot']['BootSourceOverrideMode'])
         self.assertEqual(
             [{'@odata.id': '/redfish/v1/Managers/aaaa-bbbb-cccc'}],
-            response.json['Links']['ManagedBy'])
+            body['Links']['ManagedBy'])
         self.assertEqual(
             [{'@odata.id': '/redfish/v1/Chassis/chassis0'}],
-            response.json['Links']['Chassis'])
+            body['Links']['Chassis'])
         self.assertEqual(
             {'@odata.id': '/redfish/v1/Systems/xxxx-yyyy-zzzz/VirtualMedia'},
-            response.json['VirtualMedia'])
+            body['VirtualMedia'])
+        systems_mock.uuid.assert_called_once_with('xxxx-yyyy-zzzz')
+        systems_mock.get_boot_mode.assert_called_once_with('xxxx-yyyy-zzzz')
+        get_indicator_state.assert_called_once_with('zzzz-yyyy-xxxx')
+
+    @patch_resource('indicators')
+    @patch_resource('chassis')
+    @patch_resource('managers')
+    @patch_resource('systems')
+    def test_system_resource_get_not_modified(
+            self, systems_mock, managers_mock, chassis_mock, indicators_mock):
+        systems_mock = systems_mock.return_value
+        systems_mock.uuid.return_value = 'zzzz-yyyy-xxxx'
+        systems_mock.get_power_state.return_value = 'On'
+        systems_mock.get_total_memory.return_value = 1
+        systems_mock.get_total_cpus.return_value = 2
+        systems_mock.get_boot_device.return_value = 'Cd'
+        systems_mock.get_boot_mode.return_value = 'Legacy'
+        managers_mock.return_value.get_managers_for_system.return_value = [
+            'aaaa-bbbb-cccc']
+        chassis_mock.return_value.chassis = ['chassis0']
+        indicators_mock.return_value.get_indicator_state.return_value = 'Off'
+
+        response = self.app.get('/redfish/v1/Systems/xxxx-yyyy-zzzz')
+        self.assertEqual(200, response.status_code)
+        etag = response.headers['ETag']
+
+        response = self.app.get('/redfish/v1/Systems/xxxx-yyyy-zzzz',
+                                headers={'If-None-Match': etag})
+        self.assertEqual(304, response.status_code)
+
+        # The route only renders the system for GET, HEAD must not be
+        # tagged with the ETag of its empty body
+        response = self.app.head('/redfish/v1/Systems/xxxx-yyyy-zzzz',
+                                 headers={'If-None-Match': etag})
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn('ETag', response.headers)
+
+        systems_mock.get_power_state.return_value = 'Off'
+        response = self.app.get('/redfish/v1/Systems/xxxx-yyyy-zzzz',
+                                headers={'If-None-Match': etag})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('Off', response.json['PowerState'])
 
     @patch_resource('indicators')
     @patch_resource('chassis')
@@ -330,29 +565,31 @@ class SystemsTestCase(EmulatorTestCase):
         systems_mock.get_boot_mode.return_value = 'Legacy'
         managers_mock.return_value.get_managers_for_system.return_value = [
             'aaaa-bbbb-cccc']
+        chassis_mock.return_value.chassis = ['chassis0']
 
         response = self.app.get('/redfish/v1/Systems/xxxx-yyyy-zzzz')
+        body = response.json
 
         self.assertEqual(200, response.status_code)
-        self.assertEqual('xxxx-yyyy-zzzz', response.json['Id'])
-        self.assertEqual('zzzz-yyyy-xxxx', response.json['UUID'])
-        self.assertEqual('On', response.json['PowerState'])
-        self.assertNotIn('IndicatorLED', response.json)
-        self.assertNotIn('MemorySummary', response.json)
-        self.assertNotIn('ProcessorSummary', response.json)
-        self.assertNotIn('BiosVersion', response.json)
-        self.assertNotIn('Bios', response.json)
+        self.assertEqual('xxxx-yyyy-zzzz', body['Id'])
+        self.assertEqual('zzzz-yyyy-xxxx', body['UUID'])
+        self.assertEqual('On', body['PowerState'])
+        self.assertNotIn('IndicatorLED', body)
+        self.assertNotIn('MemorySummary', body)
+        self.assertNotIn('ProcessorSummary', body)
+        self.assertNotIn('BiosVersion', body)
+        self.assertNotIn('Bios', body)
         self.assertEqual(
-            'Cd', response.json['Boot']['BootSourceOverrideTarget'])
+            'Cd', body['Boot']['BootSourceOverrideTarget'])
         self.assertEqual(
-            'Legacy', response.json['Boot']['BootSourceOverrideMode'])
+            'Legacy', body['Boot']['BootSourceOverrideMode'])
         self.assertEqual(
             [{'@odata.id': '/redfish/v1/Managers/aaaa-bbbb-cccc'}],
-            response.json['Links']['ManagedBy'])
-        self.assertNotIn('Chassis', response.json['Links'])
+            body['Links']['ManagedBy'])
+        self.assertNotIn('Chassis', body['Links'])
         self.assertEqual(
             {'@odata.id': '/redfish/v1/Systems/xxxx-yyyy-zzzz/VirtualMedia'},
-            response.json['VirtualMedia'])
+            body['VirtualMedia'])
 
     @patch_resource('indicators')
     @patch_resource('chassis')
@@ -368,25 +605,27 @@ class SystemsTestCase(EmulatorTestCase):
         systems_mock.get_boot_mode.return_value = 'Legacy'
         managers_mock.return_value.get_managers_for_system.return_value = [
             'aaaa-bbbb-cccc']
+        chassis_mock.return_value.chassis = ['chassis0']
 
         response = self.app.get('/redfish/v1/Systems/xxxx-yyyy-zzzz')
+        body = response.json
 
         self.assertEqual(200, response.status_code)
-        self.assertEqual('xxxx-yyyy-zzzz', response.json['Id'])
-        self.assertEqual('zzzz-yyyy-xxxx', response.json['UUID'])
-        self.assertEqual('On', response.json['PowerState'])
-        self.assertNotIn('IndicatorLED', response.json)
-        self.assertNotIn('MemorySummary', response.json)
-        self.assertNotIn('ProcessorSummary', response.json)
-        self.assertNotIn('BiosVersion', response.json)
-        self.assertNotIn('Bios', response.json)
+        self.assertEqual('xxxx-yyyy-zzzz', body['Id'])
+        self.assertEqual('zzzz-yyyy-xxxx', body['UUID'])
+        self.assertEqual('On', body['PowerState'])
+        self.assertNotIn('IndicatorLED', body)
+        self.assertNotIn('MemorySummary', body)
+        self.assertNotIn('ProcessorSummary', body)
+        self.assertNotIn('BiosVersion', body)
+        self.assertNotIn('Bios', body)
         self.assertEqual(
-            'Cd', response.json['Boot']['BootSourceOverrideTarget'])
+            'Cd', body['Boot']['BootSourceOverrideTarget'])
         self.assertEqual(
-            'Legacy', response.json['Boot']['BootSourceOverrideMode'])
-        self.assertNotIn('ManagedBy', response.json['Links'])
-        self.assertNotIn('Chassis', response.json['Links'])
-        self.assertNotIn('VirtualMedia', response.json)
+            'Legacy', body['Boot']['BootSourceOverrideMode'])
+        self.assertNotIn('ManagedBy', body['Links'])
+        self.assertNotIn('Chassis', body['Links'])
+        self.assertNotIn('VirtualMedia', body)
 
     @patch_resource('systems')
     def test_system_resource_patch(self, systems_mock):
@@ -410,10 +649,11 @@ class SystemsTestCase(EmulatorTestCase):
         self.assertEqual(204, response.status_code)
         insert_image.assert_called_once_with('xxxx-yyyy-zzzz', 'Cd',
                                              'http://test.url/boot.iso')
-        set_boot_device = systems_mock.return_value.set_boot_device
-        set_boot_image = systems_mock.return_value.set_boot_image
-        set_boot_mode = systems_mock.return_value.set_boot_mode
-        set_http_boot_uri = systems_mock.return_value.set_http_boot_uri
+        systems_mock = systems_mock.return_value
+        set_boot_device = systems_mock.set_boot_device
+        set_boot_image = systems_mock.set_boot_image
+        set_boot_mode = systems_mock.set_boot_mode
+        set_http_boot_uri = systems_mock.set_http_boot_uri
         set_boot_device.assert_called_once_with('xxxx-yyyy-zzzz', 'Cd')
         set_boot_image.assert_called_once_with(
             mock.ANY,
@@ -426,30 +666,33 @@ class SystemsTestCase(EmulatorTestCase):
     @patch_resource('systems')
     def test_system_reset_action_ok(self, systems_mock):
         set_power_state = systems_mock.return_value.set_power_state
-        for reset_type in ('On', 'ForceOn', 'GracefulRestart', 'ForceRestart',
-                           'Nmi'):
-            set_power_state.reset_mock()
-            data = {'ResetType': reset_type}
-            response = self.app.post(
-                '/redfish/v1/Systems/xxxx-yyyy-zzzz/Actions/'
-                'ComputerSystem.Reset',
-                json=data)
-            self.assertEqual(204, response.status_code)
-            set_power_state.assert_called_once_with('xxxx-yyyy-zzzz',
-                                                    reset_type)
-
+        for reset_type in ('On', 'ForceOn', 'ForceOff', 'GracefulShutdown',
+                           'GracefulRestart', 'ForceRestart', 'Nmi'):
+            with self.subTest(reset_type=reset_type):
+                set_power_state.reset_mock()
+                data = {'ResetType': reset_type}
+                response = self.app.post(
+                    '/redfish/v1/Systems/xxxx-yyyy-zzzz/Actions/'
+                    'ComputerSystem.Reset',
+                    json=data)
+                self.assertEqual(204, response.status_code)
+                set_power_state.assert_called_once_with('xxxx-yyyy-zzzz',
+                                                        reset_type)
+
+    @mock.patch.dict(main.app.config,
+                     {'SUSHY_EMULATOR_DISABLE_POWER_OFF': True})
     @patch_resource('systems')
     def test_system_reset_action_fail(self, systems_mock):
-        self.app.application.config['SUSHY_EMULATOR_DISABLE_POWER_OFF'] = True
-        print(self.app.application.config)
-
         for reset_type in ('ForceOff', 'GracefulShutdown'):
-            data = {'ResetType': reset_type}
-            response = self.app.post(
-                '/redfish/v1/Systems/xxxx-yyyy-zzzz/Actions/'
-                'ComputerSystem.Reset',
-                json=data)
-            self.assertEqual(400, response.status_code)
+            with self.subTest(reset_type=reset_type):
+                data = {'ResetType': reset_type}
+                response = self.app.post(
+                    '/redfish/v1/Systems/xxxx-yyyy-zzzz/Actions/'
+                    'ComputerSystem.Reset',
+                    json=data)
+                self.assertEqual(400, response.status_code)
+
+        systems_mock.return_value.set_power_state.assert_not_called()
 
     @patch_resource('indicators')
     @patch_resource('systems')
@@ -489,26 +732,48 @@ class SystemsTestCase(EmulatorTestCase):
 @patch_resource('systems')
 class BiosTestCase(EmulatorTestCase):
 
+    bios_url = EmulatorTestCase.system_url + '/BIOS'
+    bios_settings_url = bios_url + '/Settings'
+
     def test_get_bios(self, systems_mock):
         systems_mock.return_value.get_bios.return_value = {
             "attribute 1": "value 1",
             "attribute 2": "value 2"
         }
-        response = self.app.get('/redfish/v1/Systems/' + self.uuid + '/BIOS')
+        with mock.patch.object(main.orjson, 'dumps',
+                               wraps=main.orjson.dumps) as dumps_mock:
+            response = self.app.get(self.bios_url)
 
         self.assertEqual(200, response.status_code)
+        dumps_mock.assert_any_call(
+            {"attribute 1": "value 1", "attribute 2": "value 2"},
+            option=mock.ANY)
         self.assertEqual('BIOS', response.json['Id'])
         self.assertEqual({"attribute 1": "value 1",
                           "attribute 2": "value 2"},
                          response.json['Attributes'])
 
+    @mock.patch.object(main, 'orjson', None)
+    def test_get_bios_stdlib_json(self, systems_mock):
+        systems_mock.return_value.get_bios.return_value = {
+            "attribute 1": "value 1",
+            "attribute 2": 2,
+            "attribute 3": True
+        }
+        response = self.app.get(self.bios_url)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"attribute 1": "value 1",
+                          "attribute 2": 2,
+                          "attribute 3": True},
+                         response.json['Attributes'])
+
     def test_get_bios_existing(self, systems_mock):
         systems_mock.return_value.get_bios.return_value = {
             "attribute 1": "value 1",
             "attribute 2": "value 2"
         }
-        response = self.app.get(
-            '/redfish/v1/Systems/' + self.uuid + '/BIOS/Settings')
+        response = self.app.get(self.bios_settings_url)
 
         self.assertEqual(200, response.status_code)
         self.assertEqual('Settings', response.json['Id'])
@@ -537,36 +802,36 @@ class BiosTestCase(EmulatorTestCase):
             'xxxx-yyyy-zzzz', data['Attributes'])
 
     def test_reset_bios(self, systems_mock):
-        response = self.app.post('/redfish/v1/Systems/%s/BIOS/Actions/'
-                                 'Bios.ResetBios' % self.uuid)
+        response = self.app.post(self.bios_url + '/Actions/Bios.ResetBios')
         self.assertEqual(204, response.status_code)
         systems_mock.return_value.reset_bios.assert_called_once_with(self.uuid)
 
 
+TEST_NICS = (
+    {'id': 'nic1', 'mac': '52:54:00:4e:5d:37'},
+    {'id': 'nic2', 'mac': '00:11:22:33:44:55'},
+)
+
+
 @patch_resource('systems')
 class EthernetInterfacesTestCase(EmulatorTestCase):
 
+    nics_url = EmulatorTestCase.system_url + '/EthernetInterfaces'
+
     def test_ethernet_interfaces_collection(self, systems_mock):
-        systems_mock.return_value.get_nics.return_value = [
-            {'id': 'nic1', 'mac': '52:54:00:4e:5d:37'},
-            {'id': 'nic2', 'mac': '00:11:22:33:44:55'}]
-        response = self.app.get('redfish/v1/Systems/%s/EthernetInterfaces'
-                                % self.uuid)
+        systems_mock.return_value.get_nics.return_value = list(TEST_NICS)
+        response = self.app.get(self.nics_url)
 
         self.assertEqual(200, response.status_code)
         self.assertEqual('Ethernet Interface Collection',
                          response.json['Name'])
         self.assertEqual(2, response.json['Members@odata.count'])
-        self.assertEqual(['/redfish/v1/Systems/%s/EthernetInterfaces/nic1'
-                          % self.uuid,
-                          '/redfish/v1/Systems/%s/EthernetInterfaces/nic2'
-                          % self.uuid],
+        self.assertEqual([self.nics_url + '/nic1', self.nics_url + '/nic2'],
                          [m['@odata.id'] for m in response.json['Members']])
 
     def test_ethernet_interfaces_collection_empty(self, systems_mock):
         systems_mock.return_value.get_nics.return_value = []
-        response = self.app.get('redfish/v1/Systems/%s/EthernetInterfaces'
-                                % self.uuid)
+        response = self.app.get(self.nics_url)
 
         self.assertEqual(200, response.status_code)
         self.assertEqual('Ethernet Interface Collection',
@@ -575,30 +840,22 @@ class EthernetInterfacesTestCase(EmulatorTestCase):
         self.assertEqual([], response.json['Members'])
 
     def test_ethernet_interface(self, systems_mock):
-        systems_mock.return_value.get_nics.return_value = [
-            {'id': 'nic1', 'mac': '52:54:00:4e:5d:37'},
-            {'id': 'nic2', 'mac': '00:11:22:33:44:55'}]
-        response = self.app.get('/redfish/v1/Systems/%s/EthernetInterfaces/'
-                                'nic2' % self.uuid)
+        systems_mock.return_value.get_nics.return_value = list(TEST_NICS)
+        response = self.app.get(self.nics_url + '/nic2')
+        body = response.json
 
         self.assertEqual(200, response.status_code)
-        self.assertEqual('nic2', response.json['Id'])
-        self.assertEqual('VNIC nic2', response.json['Name'])
+        self.assertEqual('nic2', body['Id'])
+        self.assertEqual('VNIC nic2', body['Name'])
         self.assertEqual('00:11:22:33:44:55',
-                         response.json['PermanentMACAddress'])
+                         body['PermanentMACAddress'])
         self.assertEqual('00:11:22:33:44:55',
-                         response.json['MACAddress'])
-        self.assertEqual('/redfish/v1/Systems/%s/EthernetInterfaces/nic2'
-                         % self.uuid,
-                         response.json['@odata.id'])
+                         body['MACAddress'])
+        self.assertEqual(self.nics_url + '/nic2', body['@odata.id'])
 
     def test_ethernet_interface_not_found(self, systems_mock):
-        systems_mock.return_value.get_nics.return_value = [
-            {'id': 'nic1', 'mac': '52:54:00:4e:5d:37'},
-            {'id': 'nic2', 'mac': '00:11:22:33:44:55'}
-        ]
-        response = self.app.get('/redfish/v1/Systems/%s/EthernetInterfaces/'
-                                'nic3' % self.uuid)
+        systems_mock.return_value.get_nics.return_value = list(TEST_NICS)
+        response = self.app.get(self.nics_url + '/nic3')
 
         self.assertEqual(404, response.status_code)
 
@@ -775,10 +1032,14 @@ class StorageTestCase(EmulatorTestCase):
                 ]
             }
         }
-        response = self.app.get('/redfish/v1/Systems/%s/SimpleStorage/scsi'
-                                % self.uuid)
+        with mock.patch.object(main.app.logger, 'debug',
+                               autospec=True) as debug_mock:
+            response = self.app.get(
+                '/redfish/v1/Systems/%s/SimpleStorage/scsi' % self.uuid)
 
         self.assertEqual(404, response.status_code)
+        debug_mock.assert_any_call(
+            '"%s" Simple Storage resource was not found', 'scsi')
 
     @patch_resource('storage')
     def test_storage_collection_resource(self, storage_mock, systems_mock):
@@ -847,7 +1108,7 @@ class StorageTestCase(EmulatorTestCase):
 
     @patch_resource('volumes')
     def test_volume_collection_get(self, volumes_mock, systems_mock):
-        volumes_mock.return_value.get_volumes_col.return_value = [
+        vol_col = [
             {
                 "libvirtPoolName": "sushyPool",
                 "libvirtVolName": "testVol",
@@ -855,10 +1116,20 @@ class StorageTestCase(EmulatorTestCase):
                 "Name": "Sample Volume 1",
                 "VolumeType": "Mirrored",
                 "CapacityBytes": 23748
+            },
+            {
+                "libvirtPoolName": "sushyPool",
+                "libvirtVolName": "goneVol",
+                "Id": "2",
+                "Name": "Sample Volume 2",
+                "VolumeType": "Mirrored",
+                "CapacityBytes": 23748
             }
         ]
+        volumes_mock = volumes_mock.return_value
+        volumes_mock.get_volumes_col.return_value = vol_col
         systems_mock = systems_mock.return_value
-        systems_mock.find_or_create_storage_volume.return_value = "1"
+        systems_mock.find_or_create_storage_volumes.return_value = ["1", None]
         response = self.app.get('/redfish/v1/Systems/vmc-node/Storage/1/'
                                 'Volumes')
 
@@ -866,6 +1137,11 @@ class StorageTestCase(EmulatorTestCase):
         self.assertEqual({'@odata.id':
                           '/redfish/v1/Systems/vmc-node/Storage/1/Volumes/1'},
                          response.json['Members'][0])
+        self.assertEqual(1, response.json['Members@odata.count'])
+        systems_mock.find_or_create_storage_volumes.assert_called_once_with(
+            vol_col)
+        volumes_mock.delete_volume.assert_called_once_with(
+            mock.ANY, '1', vol_col[1])
 
     @patch_resource('volumes')
     def test_create_volume_post(self, volumes_mock, systems_mock):
@@ -910,6 +1186,24 @@ class StorageTestCase(EmulatorTestCase):
 
 class RegistryTestCase(EmulatorTestCase):
 
+    @mock.patch.object(main.flask, 'render_template', autospec=True,
+                       return_value='{}')
+    def test_static_template_cached(self, render_mock):
+        main.app.configure()
+
+        for _ in range(2):
+            response = self.app.get('/redfish/v1/Registries/Messages')
+            self.assertEqual(200, response.status_code)
+
+        render_mock.assert_called_once_with('message_registry_file.json',
+                                            feature_set='full')
+
+        self.set_feature_set('vmedia')
+        self.app.get('/redfish/v1/')
+        self.app.get('/redfish/v1/')
+        render_mock.assert_called_with('root.json', feature_set='vmedia')
+        self.assertEqual(2, render_mock.call_count)
+
     def test_registry_file_collection(self):
         response = self.app.get('/redfish/v1/Registries')
         self.assertEqual(200, response.status_code)
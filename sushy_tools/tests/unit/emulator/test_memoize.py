@@ -53,6 +53,26 @@ class MemoizeTestCase(base.BaseTestCase):
         # Due to volatile cache, expect one more call
         self.assertEqual(1, driver.call_count)
 
+    def test_cache_key(self):
+
+        class Driver(object):
+            call_count = 0
+
+            @memoize.memoize()
+            def fun(self, *args, **kwargs):
+                self.call_count += 1
+                return args, kwargs
+
+        driver = Driver()
+
+        self.assertEqual(((1, 2), {}), driver.fun(1, 2))
+        self.assertEqual(((2, 1), {}), driver.fun(2, 1))
+        self.assertEqual(((), {'x': True}), driver.fun(x=True))
+        self.assertEqual(((), {'x': False}), driver.fun(x=False))
+
+        # Argument order and keyword argument values are part of the key
+        self.assertEqual(4, driver.call_count)
+
     def test_external_cache(self):
 
         permanent_cache = {}